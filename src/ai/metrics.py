@@ -1,12 +1,32 @@
 """
 Base metrics collection and analysis implementation.
 """
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Mapping, Sequence
 from datetime import datetime, timedelta
+from operator import itemgetter
 import logging
-import pandas as pd
 import numpy as np
 
+def _column_values(values: Sequence[Any]) -> List[Any]:
+    """Convert a batch column to a list of Python values.
+    
+    NumPy datetime64/timedelta64 columns are converted at microsecond
+    precision, since tolist() turns nanosecond values into plain ints.
+    
+    Args:
+        values: List, sequence or NumPy array of column values
+    
+    Returns:
+        List of column values
+    """
+    if not isinstance(values, np.ndarray):
+        return list(values)
+    if values.dtype.kind == 'M':
+        values = values.astype('datetime64[us]')
+    elif values.dtype.kind == 'm':
+        values = values.astype('timedelta64[us]')
+    return values.tolist()
+
 class BaseMetricsCollector:
     """Base class for collecting and analyzing metrics."""
     
@@ -21,6 +41,30 @@ class BaseMetricsCollector:
         self._analysis_window = timedelta(hours=1)
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    def _latest_metrics(self) -> Optional[Dict[str, Any]]:
+        """Return the most recently added metrics dictionary, if any."""
+        return self.metrics_history[-1] if self.metrics_history else None
+    
+    @staticmethod
+    def _bisect_history(history: List[Dict[str, Any]], cutoff_time: datetime) -> int:
+        """Find the index of the first entry at or after cutoff_time.
+        
+        Args:
+            history: Metrics dictionaries sorted by timestamp
+            cutoff_time: Timestamp to search for
+        
+        Returns:
+            Index of the first entry whose timestamp is not before cutoff_time
+        """
+        low, high = 0, len(history)
+        while low < high:
+            mid = (low + high) // 2
+            if history[mid]['timestamp'] < cutoff_time:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+    
     def collect_metrics(self, entity_id: str, entity_data: Dict[str, Any]) -> Dict[str, Any]:
         """Collect metrics for an entity.
         
@@ -40,6 +84,31 @@ class BaseMetricsCollector:
             self.logger.error(f"Failed to collect metrics for {entity_id}: {str(e)}")
             return {}
     
+    def add_metrics_batch(self, batch: Mapping[str, Sequence[Any]]) -> int:
+        """Add a batch of metrics given as equal-length columns.
+        
+        Each key maps to a sequence (list or NumPy array) holding one value per
+        entry. Entries without a 'timestamp' column share a single timestamp.
+        
+        Args:
+            batch: Mapping of metric name to column of values
+        
+        Returns:
+            Number of entries added to the history
+        """
+        columns = {key: _column_values(values) for key, values in batch.items()}
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All metric columns must have the same length")
+        count = lengths.pop() if lengths else 0
+        
+        if 'timestamp' not in columns:
+            columns['timestamp'] = [datetime.now()] * count
+        
+        keys = list(columns)
+        self.metrics_history.extend(dict(zip(keys, row)) for row in zip(*columns.values()))
+        return count
+    
     def _collect_entity_metrics(self, entity_id: str, entity_data: Dict[str, Any]) -> Dict[str, Any]:
         """Collect metrics for a specific entity. To be implemented by subclasses.
         
@@ -104,15 +173,18 @@ class BaseMetricsCollector:
     def cleanup_old_metrics(self, max_age: timedelta = timedelta(days=7)) -> None:
         """Clean up metrics older than max_age.
         
+        The history is sorted by timestamp into a new list, which is linear
+        when it is already in order, so the expired entries can be located
+        with a binary search. After a successful cleanup metrics_history is
+        in time order.
+        
         Args:
             max_age: Maximum age of metrics to keep
         """
         try:
-            current_time = datetime.now()
-            self.metrics_history = [
-                m for m in self.metrics_history
-                if current_time - m['timestamp'] <= max_age
-            ]
+            cutoff_time = datetime.now() - max_age
+            history = sorted(self.metrics_history, key=itemgetter('timestamp'))
+            self.metrics_history = history[self._bisect_history(history, cutoff_time):]
         except Exception as e:
             self.logger.error(f"Failed to cleanup old metrics: {str(e)}")
     
@@ -1,7 +1,7 @@
 """
 Node metrics collector implementation.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 from .metrics import BaseMetricsCollector
@@ -81,11 +81,8 @@ class NodeMetricsCollector(BaseMetricsCollector):
             Dictionary containing analysis results
         """
         try:
-            # Calculate statistics
-            stats = self._calculate_statistics(metrics)
-            
-            # Determine trends
-            trends = self._determine_trends(metrics)
+            # Calculate statistics and trends in a single pass
+            stats, trends = self._summarize_metrics(metrics)
             
             # Determine status and health
             status = self._determine_status(stats, trends)
@@ -121,15 +118,7 @@ class NodeMetricsCollector(BaseMetricsCollector):
         Returns:
             Dictionary containing statistics for each metric
         """
-        stats = {}
-        for key, value in metrics.items():
-            if isinstance(value, (int, float)):
-                stats[key] = {
-                    'mean': value,
-                    'min': value,
-                    'max': value
-                }
-        return stats
+        return self._summarize_metrics(metrics)[0]
     
     def _determine_trends(self, metrics: Dict[str, Any]) -> Dict[str, str]:
         """Determine trends in metrics.
@@ -140,20 +129,42 @@ class NodeMetricsCollector(BaseMetricsCollector):
         Returns:
             Dictionary containing trend information
         """
+        return self._summarize_metrics(metrics)[1]
+    
+    def _summarize_metrics(self, metrics: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, float]], Dict[str, str]]:
+        """Calculate statistics and trends for metrics in one pass.
+        
+        Args:
+            metrics: Dictionary containing metric values
+        
+        Returns:
+            Tuple of (statistics for each metric, trend for each metric)
+        """
+        stats = {}
         trends = {}
+        previous = self._latest_metrics()
         for key, value in metrics.items():
-            if isinstance(value, (int, float)):
-                if len(self.metrics_history) > 0:
-                    prev_value = self.metrics_history[-1].get(key, value)
-                    if value > prev_value * 1.1:
-                        trends[key] = 'increasing'
-                    elif value < prev_value * 0.9:
-                        trends[key] = 'decreasing'
-                    else:
-                        trends[key] = 'stable'
-                else:
-                    trends[key] = 'unknown'
-        return trends
+            if not isinstance(value, (int, float)):
+                continue
+            
+            stats[key] = {
+                'mean': value,
+                'min': value,
+                'max': value
+            }
+            
+            if previous is None:
+                trends[key] = 'unknown'
+                continue
+            
+            prev_value = previous.get(key, value)
+            if value > prev_value * 1.1:
+                trends[key] = 'increasing'
+            elif value < prev_value * 0.9:
+                trends[key] = 'decreasing'
+            else:
+                trends[key] = 'stable'
+        return stats, trends
     
     def _determine_status(self, stats: Dict[str, Dict[str, float]], trends: Dict[str, str]) -> str:
         """Determine node status based on metrics.
@@ -168,22 +179,27 @@ class NodeMetricsCollector(BaseMetricsCollector):
         if not stats:
             return 'unknown'
         
+        thresholds = self.thresholds
+        
         # Check for critical metrics
-        if 'cpu_usage' in stats and 'memory_usage' in stats:
-            cpu_mean = stats['cpu_usage']['mean']
-            memory_mean = stats['memory_usage']['mean']
+        cpu = stats.get('cpu_usage')
+        memory = stats.get('memory_usage')
+        if cpu is not None and memory is not None:
+            cpu_mean = cpu['mean']
+            memory_mean = memory['mean']
             
-            if cpu_mean > self.thresholds['cpu_critical'] or memory_mean > self.thresholds['memory_critical']:
+            if cpu_mean > thresholds['cpu_critical'] or memory_mean > thresholds['memory_critical']:
                 return 'offline'
-            elif cpu_mean > self.thresholds['cpu_warning'] or memory_mean > self.thresholds['memory_warning']:
+            elif cpu_mean > thresholds['cpu_warning'] or memory_mean > thresholds['memory_warning']:
                 return 'degraded'
         
         # Check for disk space
-        if 'disk_usage' in stats:
-            disk_usage = stats['disk_usage']['mean']
-            if disk_usage > self.thresholds['disk_critical']:
+        disk = stats.get('disk_usage')
+        if disk is not None:
+            disk_usage = disk['mean']
+            if disk_usage > thresholds['disk_critical']:
                 return 'offline'
-            elif disk_usage > self.thresholds['disk_warning']:
+            elif disk_usage > thresholds['disk_warning']:
                 return 'degraded'
         
         return 'online'
@@ -201,22 +217,27 @@ class NodeMetricsCollector(BaseMetricsCollector):
         if not stats:
             return 'unknown'
         
+        thresholds = self.thresholds
+        
         # Check for resource usage
-        if 'cpu_usage' in stats and 'memory_usage' in stats:
-            cpu_mean = stats['cpu_usage']['mean']
-            memory_mean = stats['memory_usage']['mean']
+        cpu = stats.get('cpu_usage')
+        memory = stats.get('memory_usage')
+        if cpu is not None and memory is not None:
+            cpu_mean = cpu['mean']
+            memory_mean = memory['mean']
             
-            if cpu_mean > self.thresholds['cpu_critical'] or memory_mean > self.thresholds['memory_critical']:
+            if cpu_mean > thresholds['cpu_critical'] or memory_mean > thresholds['memory_critical']:
                 return 'critical'
-            elif cpu_mean > self.thresholds['cpu_warning'] or memory_mean > self.thresholds['memory_warning']:
+            elif cpu_mean > thresholds['cpu_warning'] or memory_mean > thresholds['memory_warning']:
                 return 'warning'
         
         # Check for temperature if available
-        if 'temperature' in stats:
-            temp = stats['temperature']['mean']
-            if temp > self.thresholds['temp_critical']:
+        temperature = stats.get('temperature')
+        if temperature is not None:
+            temp = temperature['mean']
+            if temp > thresholds['temp_critical']:
                 return 'critical'
-            elif temp > self.thresholds['temp_warning']:
+            elif temp > thresholds['temp_warning']:
                 return 'warning'
         
         return 'healthy'
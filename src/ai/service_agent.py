@@ -3,6 +3,7 @@ Service management agent implementation.
 """
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import cached_property
 import logging
 from .base import BaseAIAgent
 from .service_metrics import ServiceMetricsCollector
@@ -18,9 +19,13 @@ class ServiceManagementAgent(BaseAIAgent):
             config: Optional configuration dictionary
         """
         super().__init__(client, config)
-        self.metrics_collector = ServiceMetricsCollector(config)
         self._deployment_history: List[Dict[str, Any]] = []
     
+    @cached_property
+    def metrics_collector(self) -> ServiceMetricsCollector:
+        """Service metrics collector, created on first access."""
+        return ServiceMetricsCollector(self.config)
+    
     async def analyze(self) -> Dict[str, Any]:
         """Analyze services and generate recommendations.
         
@@ -121,7 +126,7 @@ class ServiceManagementAgent(BaseAIAgent):
         """
         recommendation = recommendation.lower()
         
-        if 'scale' in recommendation:
+        if 'scal' in recommendation:
             return 'scale'
         elif 'update' in recommendation:
             return 'update'
@@ -113,9 +113,9 @@ class ServiceMetricsCollector(BaseMetricsCollector):
             Response time in milliseconds
         """
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = requests.get(url, timeout=5)
-            response_time = (time.time() - start_time) * 1000  # Convert to ms
+            response_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
             response.raise_for_status()
             
             # Update response time history
@@ -3,6 +3,7 @@ Unit tests for the metrics collector implementation.
 """
 import pytest
 from unittest.mock import Mock, patch
+import numpy as np
 from datetime import datetime, timedelta
 from src.ai.metrics import BaseMetricsCollector
 
@@ -82,6 +83,34 @@ class TestBaseMetricsCollector:
         metrics = collector.collect_metrics(entity_id, entity_data)
         assert metrics == {}
     
+    def test_add_metrics_batch(self, collector):
+        """Test adding a columnar batch of metrics."""
+        count = collector.add_metrics_batch({
+            'cpu_usage': np.arange(3, dtype=float),
+            'memory_usage': [10.0, 20.0, 30.0]
+        })
+        assert count == 3
+        assert len(collector.metrics_history) == 3
+        assert [m['cpu_usage'] for m in collector.metrics_history] == [0.0, 1.0, 2.0]
+        assert collector.metrics_history[2]['memory_usage'] == 30.0
+        assert all(isinstance(m['timestamp'], datetime) for m in collector.metrics_history)
+    
+    def test_add_metrics_batch_datetime64(self, collector):
+        """Test nanosecond datetime64 timestamps are stored as datetimes and can be cleaned up."""
+        now = datetime.now().replace(microsecond=0)
+        timestamps = np.array([now - timedelta(days=8), now], dtype='datetime64[ns]')
+        collector.add_metrics_batch({'timestamp': timestamps, 'test': [1, 2]})
+        assert [m['timestamp'] for m in collector.metrics_history] == [now - timedelta(days=8), now]
+        
+        collector.cleanup_old_metrics(max_age=timedelta(days=7))
+        assert [m['test'] for m in collector.metrics_history] == [2]
+    
+    def test_add_metrics_batch_length_mismatch(self, collector):
+        """Test adding a batch with columns of different lengths."""
+        with pytest.raises(ValueError):
+            collector.add_metrics_batch({'cpu_usage': [1.0, 2.0], 'memory_usage': [1.0]})
+        assert collector.metrics_history == []
+    
     def test_get_metrics_history(self, collector):
         """Test metrics history retrieval."""
         # Add some test metrics
@@ -139,6 +168,33 @@ class TestBaseMetricsCollector:
         assert len(collector.metrics_history) == 4
         assert all(m['test'] in (2, 3, 4, 5) for m in collector.metrics_history)
     
+    def test_cleanup_old_metrics_unsorted(self, collector):
+        """Test cleanup of old metrics added out of time order."""
+        now = datetime.now()
+        collector.add_metrics_batch({
+            'timestamp': [now, now - timedelta(days=9), now - timedelta(days=3), now - timedelta(days=8)],
+            'test': [1, 2, 3, 4]
+        })
+        collector.cleanup_old_metrics(max_age=timedelta(days=7))
+        assert [m['test'] for m in collector.metrics_history] == [3, 1]
+        
+        collector.add_metrics_batch({'timestamp': [now - timedelta(minutes=5)], 'test': [5]})
+        history = collector.get_metrics_history(window_minutes=10)
+        assert sorted(m['test'] for m in history) == [1, 5]
+    
+    def test_metrics_history_appended_directly(self, collector):
+        """Test entries appended straight to the history are kept and expired by cleanup."""
+        now = datetime.now()
+        assigned = [{'timestamp': now, 'test': 1}]
+        collector.metrics_history = assigned
+        collector.metrics_history.append({'timestamp': now - timedelta(days=30), 'test': 2})
+        collector.metrics_history.append({'timestamp': now - timedelta(minutes=1), 'test': 3})
+        assert len(collector.metrics_history) == 3
+        
+        collector.cleanup_old_metrics(max_age=timedelta(days=7))
+        assert [m['test'] for m in collector.metrics_history] == [3, 1]
+        assert len(assigned) == 3
+    
     def test_cleanup_old_metrics_error(self, collector):
         """Test cleanup of old metrics with error handling."""
         collector.metrics_history = [{'invalid': 'data'}]
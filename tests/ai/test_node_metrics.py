@@ -109,6 +109,14 @@ class TestNodeMetricsCollector:
         trends = collector._determine_trends(metrics)
         assert trends['cpu_usage'] == 'increasing'
     
+    def test_analyze_metrics_after_history_change(self, collector):
+        """Test analysis trends follow a change to the history."""
+        metrics = {'cpu_usage': 50.0}
+        assert collector.analyze_metrics(metrics)['trends']['cpu_usage'] == 'unknown'
+        
+        collector.metrics_history = [{'timestamp': datetime.now(), 'cpu_usage': 10.0}]
+        assert collector.analyze_metrics(metrics)['trends']['cpu_usage'] == 'increasing'
+    
     def test_determine_status_online(self, collector):
         """Test status determination for online node."""
         stats = {
@@ -145,6 +153,46 @@ class TestNodeMetricsCollector:
         status = collector._determine_status(stats, trends)
         assert status == 'offline'
     
+    @pytest.mark.parametrize("stats,expected", [
+        ({}, 'unknown'),
+        ({'cpu_usage': {'mean': 96.0}, 'memory_usage': {'mean': 85.0}}, 'offline'),
+        ({'cpu_usage': {'mean': 50.0}, 'memory_usage': {'mean': 60.0}, 'disk_usage': {'mean': 96.0}}, 'offline'),
+        ({'cpu_usage': {'mean': 85.0}, 'memory_usage': {'mean': 75.0}}, 'degraded'),
+        ({'cpu_usage': {'mean': 50.0}, 'memory_usage': {'mean': 60.0}, 'disk_usage': {'mean': 85.0}}, 'degraded'),
+    ], ids=['unknown', 'offline_cpu', 'offline_disk', 'degraded_cpu', 'degraded_disk'])
+    def test_determine_status_single_metric(self, collector, stats, expected):
+        """Test status determination when a single metric crosses its threshold."""
+        assert collector._determine_status(stats, {}) == expected
+    
+    def test_determine_status_thresholds_exclusive(self, collector):
+        """Test status determination for metrics exactly at their thresholds."""
+        stats = {
+            'cpu_usage': {'mean': 70.0},
+            'memory_usage': {'mean': 90.0},
+            'disk_usage': {'mean': 95.0}
+        }
+        trends = {}
+        
+        status = collector._determine_status(stats, trends)
+        assert status == 'degraded'
+    
+    def test_thresholds_changed_after_init(self, collector):
+        """Test status, health and alerts all follow thresholds changed after construction."""
+        collector.thresholds['cpu_warning'] = 10
+        stats = {'cpu_usage': {'mean': 50.0}, 'memory_usage': {'mean': 20.0}}
+        
+        assert collector._determine_status(stats, {}) == 'degraded'
+        assert collector._determine_health(stats, {}) == 'warning'
+        assert any(alert['type'] == 'warning' for alert in collector._generate_alerts(stats, {}))
+    
+    def test_analyze_metrics_thresholds_changed(self, collector):
+        """Test analyze_metrics follows a threshold changed between two calls."""
+        metrics = {'cpu_usage': 50.0, 'memory_usage': 20.0}
+        assert collector.analyze_metrics(metrics)['status'] == 'online'
+        
+        collector.thresholds['cpu_warning'] = 10
+        assert collector.analyze_metrics(metrics)['status'] == 'degraded'
+    
     def test_determine_health_healthy(self, collector):
         """Test health determination for healthy node."""
         stats = {
@@ -181,6 +229,17 @@ class TestNodeMetricsCollector:
         health = collector._determine_health(stats, trends)
         assert health == 'critical'
     
+    @pytest.mark.parametrize("stats,expected", [
+        ({}, 'unknown'),
+        ({'cpu_usage': {'mean': 95.0}, 'memory_usage': {'mean': 85.0}}, 'critical'),
+        ({'cpu_usage': {'mean': 50.0}, 'memory_usage': {'mean': 60.0}, 'temperature': {'mean': 85.0}}, 'critical'),
+        ({'cpu_usage': {'mean': 75.0}, 'memory_usage': {'mean': 65.0}}, 'warning'),
+        ({'cpu_usage': {'mean': 50.0}, 'memory_usage': {'mean': 60.0}, 'temperature': {'mean': 75.0}}, 'warning'),
+    ], ids=['unknown', 'critical_cpu', 'critical_temperature', 'warning_cpu', 'warning_temperature'])
+    def test_determine_health_single_metric(self, collector, stats, expected):
+        """Test health determination when a single metric crosses its threshold."""
+        assert collector._determine_health(stats, {}) == expected
+    
     def test_generate_alerts(self, collector):
         """Test alert generation."""
         stats = {
@@ -194,4 +253,57 @@ class TestNodeMetricsCollector:
         alerts = collector._generate_alerts(stats, trends)
         assert len(alerts) > 0
         assert any(alert['type'] == 'critical' for alert in alerts)
-        assert any(alert['type'] == 'warning' for alert in alerts) 
\ No newline at end of file
+        assert any(alert['type'] == 'warning' for alert in alerts)
+    
+    @pytest.mark.parametrize("metric,value,message", [
+        ('cpu_usage', 95.0, 'CPU usage is critical'),
+        ('memory_usage', 95.0, 'Memory usage is critical'),
+        ('disk_usage', 96.0, 'Disk usage is critical'),
+        ('temperature', 85.0, 'Temperature is critical'),
+    ], ids=['cpu_usage', 'memory_usage', 'disk_usage', 'temperature'])
+    def test_generate_alerts_single_metric(self, collector, metric, value, message):
+        """Test alert generation for each metric on its own."""
+        alerts = collector._generate_alerts({metric: {'mean': value}}, {})
+        
+        assert any(
+            a['type'] == 'critical' and a['message'].startswith(message)
+            for a in alerts
+        )
+    
+    def test_analyze_metrics_integration(self, collector):
+        """Test the complete metrics analysis workflow."""
+        metrics = [
+            {
+                'cpu_usage': 50.0,
+                'memory_usage': 60.0,
+                'disk_usage': 70.0,
+                'temperature': 65.0
+            },
+            {
+                'cpu_usage': 70.0,
+                'memory_usage': 80.0,
+                'disk_usage': 80.0,
+                'temperature': 75.0
+            }
+        ]
+        
+        # Seed the history with the first snapshot; trends compare the latest with it
+        collector.metrics_history = metrics[:1]
+        
+        analysis = collector.analyze_metrics(metrics[-1])
+        
+        # Check status and health
+        assert analysis['status'] == 'degraded'
+        assert analysis['health'] == 'warning'
+        
+        # Check trends
+        assert analysis['trends']['cpu_usage'] == 'increasing'
+        assert analysis['trends']['memory_usage'] == 'increasing'
+        assert analysis['trends']['disk_usage'] == 'increasing'
+        assert analysis['trends']['temperature'] == 'increasing'
+        
+        # Check alerts
+        assert any(
+            a['type'] == 'warning' and a['message'].startswith('Temperature is high')
+            for a in analysis['alerts']
+        )
@@ -63,6 +63,7 @@ class TestServiceManagementAgent:
     def test_determine_action(self, agent):
         """Test action determination from recommendations."""
         assert agent._determine_action("Scale up CPU resources") == 'scale'
+        assert agent._determine_action("Immediate CPU scaling required") == 'scale'
         assert agent._determine_action("Update service configuration") == 'update'
         assert agent._determine_action("Restart service") == 'restart'
         assert agent._determine_action("Check service logs") == 'investigate'
@@ -3,11 +3,27 @@ Unit tests for the service metrics collector implementation.
 """
 import pytest
 from unittest.mock import Mock, patch
-from datetime import datetime
+from datetime import datetime, timedelta
 import psutil
 import requests
 from src.ai.service_metrics import ServiceMetricsCollector
 
+# Frozen clock shared by the time-based tests
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+class FakeDatetime(datetime):
+    """datetime whose now() always returns NOW."""
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+def _response(status_code):
+    """Build a real requests.Response with the given status code."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = 'http://test.com'
+    return response
+
 class TestServiceMetricsCollector:
     """Test cases for ServiceMetricsCollector."""
     
@@ -73,18 +89,29 @@ class TestServiceMetricsCollector:
         metrics = collector._get_container_metrics('test_service')
         assert metrics == {}
     
-    @patch('requests.get')
-    def test_measure_response_time(self, mock_get, collector):
+    def test_measure_response_time(self, collector, monkeypatch):
         """Test response time measurement."""
-        mock_get.return_value = Mock(status_code=200)
+        response = _response(200)
+        monkeypatch.setattr(requests, 'get', lambda url, timeout: response)
         response_time = collector._measure_response_time('test_service', 'http://test.com')
         assert isinstance(response_time, float)
         assert response_time > 0
+        assert collector._request_counts['test_service'] == 1
     
-    @patch('requests.get')
-    def test_measure_response_time_error(self, mock_get, collector):
+    def test_measure_response_time_http_error(self, collector, monkeypatch):
+        """Test response time measurement with an error status code."""
+        response = _response(500)
+        monkeypatch.setattr(requests, 'get', lambda url, timeout: response)
+        response_time = collector._measure_response_time('test_service', 'http://test.com')
+        assert response_time == float('inf')
+        assert collector._error_counts['test_service'] == 1
+    
+    def test_measure_response_time_error(self, collector, monkeypatch):
         """Test response time measurement with error."""
-        mock_get.side_effect = requests.RequestException()
+        def fail(url, timeout):
+            raise requests.RequestException()
+        
+        monkeypatch.setattr(requests, 'get', fail)
         response_time = collector._measure_response_time('test_service', 'http://test.com')
         assert response_time == float('inf')
     
@@ -138,4 +165,93 @@ class TestServiceMetricsCollector:
         assert analysis['status'] == 'critical'
         assert analysis['health'] == 'poor'
         assert len(analysis['alerts']) > 0
-        assert len(analysis['recommendations']) > 0 
\ No newline at end of file
+        assert len(analysis['recommendations']) > 0
+    
+    def test_analyze_entity_metrics_thresholds_changed(self, collector):
+        """Test that thresholds changed after initialization are used."""
+        collector.thresholds['cpu_warning'] = 40
+        metrics = {
+            'cpu_usage': 50.0,
+            'memory_usage': 60.0,
+            'response_time': 500.0,
+            'error_rate': 0.01
+        }
+        analysis = collector._analyze_entity_metrics(metrics)
+        assert analysis['status'] == 'warning'
+        assert analysis['alerts'] == ['High CPU usage']
+    
+    def test_analyze_metrics_thresholds_changed(self, collector):
+        """Test analyze_metrics follows a threshold changed between two calls."""
+        metrics = {
+            'cpu_usage': 50.0,
+            'memory_usage': 60.0,
+            'response_time': 500.0,
+            'error_rate': 0.01
+        }
+        assert collector.analyze_metrics(metrics)['status'] == 'healthy'
+        
+        collector.thresholds['cpu_warning'] = 40
+        assert collector.analyze_metrics(metrics)['status'] == 'warning'
+    
+    def test_collect_metrics(self, collector, monkeypatch):
+        """Test metrics collection for a service."""
+        container_metrics = {
+            'cpu_usage': 50.0,
+            'memory_usage': 60.0,
+            'memory_rss': 100.0,
+            'threads': 4,
+            'open_files': 1,
+            'connections': 1
+        }
+        monkeypatch.setattr(collector, '_get_container_metrics', lambda *_: container_metrics)
+        monkeypatch.setattr(collector, '_measure_response_time', lambda *_: 100.0)
+        monkeypatch.setattr(collector, '_calculate_error_rate', lambda *_: 0.1)
+        
+        metrics = collector.collect_metrics('test_service', {'url': 'http://test.com'})
+        assert metrics['cpu_usage'] == 50.0
+        assert metrics['memory_usage'] == 60.0
+        assert metrics['memory_rss'] == 100.0
+        assert metrics['response_time'] == 100.0
+        assert metrics['error_rate'] == 0.1
+        assert isinstance(metrics['timestamp'], datetime)
+    
+    def test_get_metrics_history(self, collector, monkeypatch):
+        """Test metrics history retrieval within a time window."""
+        monkeypatch.setattr('src.ai.metrics.datetime', FakeDatetime)
+        collector.metrics_history = [
+            {'timestamp': NOW - timedelta(minutes=30)},
+            {'timestamp': NOW - timedelta(minutes=45)},
+            {'timestamp': NOW - timedelta(minutes=90)}
+        ]
+        
+        recent_metrics = collector.get_metrics_history(window_minutes=60)
+        assert len(recent_metrics) == 2
+    
+    def test_analyze_metrics_warning(self, collector):
+        """Test public metrics analysis for service with warnings."""
+        metrics = {
+            'cpu_usage': 85.0,
+            'memory_usage': 75.0,
+            'response_time': 1500.0,
+            'error_rate': 0.06
+        }
+        analysis = collector.analyze_metrics(metrics)
+        assert analysis['status'] == 'warning'
+        assert analysis['health'] == 'good'
+        assert len(analysis['alerts']) > 0
+        assert len(analysis['recommendations']) > 0
+        assert analysis['metrics'] == metrics
+    
+    def test_analyze_metrics_critical(self, collector):
+        """Test public metrics analysis for service with critical issues."""
+        metrics = {
+            'cpu_usage': 95.0,
+            'memory_usage': 95.0,
+            'response_time': 2500.0,
+            'error_rate': 0.15
+        }
+        analysis = collector.analyze_metrics(metrics)
+        assert analysis['status'] == 'critical'
+        assert analysis['health'] == 'poor'
+        assert any('Critical' in alert for alert in analysis['alerts'])
+        assert any('Immediate' in rec for rec in analysis['recommendations'])
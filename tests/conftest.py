@@ -0,0 +1,95 @@
+"""
+Shared test fixtures for top-level tests.
+"""
+import asyncio
+import os
+import pytest
+from unittest.mock import Mock, create_autospec
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+# Sample valid node data
+_VALID_NODE_DATA = {
+    'id': 'node1',
+    'org_id': 'examples',
+    'pattern': 'pattern1',
+    'name': 'Test Node',
+    'nodeType': 'device',
+    'publicKey': 'key123',
+    'token': 'token123',
+    'registeredServices': [],
+    'policy': {}
+}
+
+@pytest.fixture
+def node_client():
+    """Create a mock Exchange client for NodeManager."""
+    return Mock()
+
+@pytest.fixture
+def node_manager(node_client):
+    """Create a NodeManager backed by the mock client."""
+    # Imported here so test modules that don't use nodes never load src.nodes
+    from src.nodes import NodeManager
+    return NodeManager(node_client)
+
+@pytest.fixture
+def valid_node_data():
+    """Create a copy of the sample valid node data that tests may mutate."""
+    return _VALID_NODE_DATA.copy()
+
+class _ServiceAgentClient:
+    """Exchange client interface ServiceManagementAgent calls, used as the mock spec."""
+    org_id: str
+    def get_services(self): ...
+    def get_service(self, service_id): ...
+    def update_service(self, org_id, service_id, update_data): ...
+
+@pytest.fixture(scope="session")
+def exchange_client():
+    """Create a mock Exchange API client; tests configure the calls they need."""
+    client = create_autospec(_ServiceAgentClient, instance=True)
+    client.org_id = os.getenv("EXCHANGE_ORG", "testorg")
+    return client
+
+class _StubClient:
+    """Minimal stand-in for an ExchangeAPIClient with org_id and one mock per named call."""
+    def __init__(self, mock_class, *names):
+        self.org_id = "test-org"
+        self._names = names
+        for name in names:
+            setattr(self, name, mock_class())
+    
+    def reset_mock(self, **kwargs):
+        """Reset every mocked client call."""
+        for name in self._names:
+            getattr(self, name).reset_mock(**kwargs)
+
+@pytest.fixture(scope="session")
+def make_stub_client():
+    """Return a factory for stub clients: make_stub_client(AsyncMock, "get", "post")."""
+    return _StubClient
+
+# Client fixtures that may be shared across tests and are reset after each one
+_SHARED_CLIENTS = ("mock_client", "exchange_client")
+
+@pytest.fixture(autouse=True)
+def _reset_mock_clients(request):
+    """Reset the mock clients' calls and configuration after each test using them."""
+    clients = [request.getfixturevalue(name) for name in _SHARED_CLIENTS if name in request.fixturenames]
+    yield
+    for client in clients:
+        client.reset_mock(return_value=True, side_effect=True)
+
+@pytest.fixture(scope="session")
+def service_agent(exchange_client):
+    """Create a service agent shared by the integration tests."""
+    from src.ai.service_agent import ServiceManagementAgent
+    return ServiceManagementAgent(exchange_client)
@@ -1,7 +1,6 @@
 import unittest
 from datetime import datetime, timedelta
 import os
-import asyncio
 import json
 from unittest.mock import patch, MagicMock
 from src.ai.metrics import MetricsCollector
@@ -9,7 +8,7 @@ from src.ai.service_metrics import ServiceMetricsCollector
 from src.ai.node_metrics import NodeMetricsCollector
 from src.exchange.client import ExchangeAPIClient
 
-class TestMetricsAPIIntegration(unittest.TestCase):
+class TestMetricsAPIIntegration(unittest.IsolatedAsyncioTestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment with API client and metrics collectors."""
@@ -216,10 +215,5 @@ class TestMetricsAPIIntegration(unittest.TestCase):
             self.assertEqual(recent_metrics[i]["cpu_usage"], service["metrics"]["cpu_usage"])
             self.assertEqual(recent_metrics[i]["memory_usage"], service["metrics"]["memory_usage"])
 
-def run_async_test(coro):
-    """Helper function to run async tests."""
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(coro)
-
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
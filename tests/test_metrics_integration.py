@@ -7,9 +7,8 @@ from src.ai.service_agent import ServiceManagementAgent
 from src.ai.node_agent import NodeManagementAgent
 from src.exchange.client import ExchangeAPIClient
 import os
-import asyncio
 
-class TestMetricsIntegration(unittest.TestCase):
+class TestMetricsIntegration(unittest.IsolatedAsyncioTestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test environment with API client and agents."""
@@ -182,10 +181,5 @@ class TestMetricsIntegration(unittest.TestCase):
         collector = ServiceMetricsCollector()
         self.assertEqual(collector._analysis_window, timedelta(minutes=15))
 
-def run_async_test(coro):
-    """Helper function to run async tests."""
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(coro)
-
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
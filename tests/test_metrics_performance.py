@@ -1,41 +1,24 @@
 import unittest
 import time
 import psutil
-import os
 import asyncio
+import numpy as np
 from datetime import datetime, timedelta
-from src.ai.metrics import MetricsCollector
 from src.ai.service_metrics import ServiceMetricsCollector
 from src.ai.node_metrics import NodeMetricsCollector
-from src.ai.service_agent import ServiceManagementAgent
-from src.ai.node_agent import NodeManagementAgent
-from src.exchange.client import ExchangeAPIClient
 
-class TestMetricsPerformance(unittest.TestCase):
+class TestMetricsPerformance(unittest.IsolatedAsyncioTestCase):
     @classmethod
     def setUpClass(cls):
-        """Set up test environment with API client and agents."""
-        # Initialize API client with test credentials
-        cls.client = ExchangeAPIClient(
-            base_url=os.getenv("EXCHANGE_URL", "http://localhost:8080"),
-            org=os.getenv("EXCHANGE_ORG", "testorg"),
-            username=os.getenv("EXCHANGE_USERNAME", "testuser"),
-            password=os.getenv("EXCHANGE_PASSWORD", "testpass")
-        )
-        
-        # Initialize agents
-        cls.service_agent = ServiceManagementAgent(cls.client)
-        cls.node_agent = NodeManagementAgent(cls.client)
-        
-        # Initialize metrics collectors
-        cls.service_metrics = ServiceMetricsCollector()
-        cls.node_metrics = NodeMetricsCollector()
-        
-        # Get initial memory usage
-        cls.initial_memory = psutil.Process().memory_info().rss
+        """Set up the process handle used to measure memory usage."""
+        cls.process = psutil.Process()
 
     def setUp(self):
-        """Set up test data before each test."""
+        """Set up fresh metrics collectors and test data before each test."""
+        # Each test counts the entries it adds, so collectors are not shared
+        self.service_metrics = ServiceMetricsCollector()
+        self.node_metrics = NodeMetricsCollector()
+        
         # Sample service metrics
         self.service_metrics_data = {
             'cpu_usage': 65.5,
@@ -54,45 +37,51 @@ class TestMetricsPerformance(unittest.TestCase):
             'timestamp': datetime.now()
         }
 
+    @staticmethod
+    def _batch(base, num_metrics, **columns):
+        """Build a columnar metrics batch from a sample, overriding the given columns."""
+        batch = {key: np.full(num_metrics, value, dtype=object) for key, value in base.items()}
+        batch.update(columns)
+        return batch
+
     def test_metrics_collection_performance(self):
         """Test performance of metrics collection."""
-        # Test adding multiple metrics
-        start_time = time.time()
+        # Test adding multiple metrics as one batch per collector
         num_metrics = 1000
+        service_batch = self._batch(self.service_metrics_data, num_metrics)
+        node_batch = self._batch(self.node_metrics_data, num_metrics)
         
-        for _ in range(num_metrics):
-            self.service_metrics.add_metrics(self.service_metrics_data)
-            self.node_metrics.add_metrics(self.node_metrics_data)
+        start_time = time.perf_counter_ns()
+        self.service_metrics.add_metrics_batch(service_batch)
+        self.node_metrics.add_metrics_batch(node_batch)
         
-        end_time = time.time()
-        collection_time = end_time - start_time
+        collection_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # Verify performance
         self.assertLess(collection_time, 1.0)  # Should take less than 1 second
-        self.assertEqual(len(self.service_metrics.get_recent_metrics()), num_metrics)
-        self.assertEqual(len(self.node_metrics.get_recent_metrics()), num_metrics)
+        self.assertEqual(len(self.service_metrics.get_metrics_history()), num_metrics)
+        self.assertEqual(len(self.node_metrics.get_metrics_history()), num_metrics)
 
     def test_metrics_analysis_performance(self):
         """Test performance of metrics analysis."""
         # Add test metrics
         num_metrics = 1000
-        for _ in range(num_metrics):
-            self.service_metrics.add_metrics(self.service_metrics_data)
-            self.node_metrics.add_metrics(self.node_metrics_data)
+        self.service_metrics.add_metrics_batch(self._batch(self.service_metrics_data, num_metrics))
+        self.node_metrics.add_metrics_batch(self._batch(self.node_metrics_data, num_metrics))
         
-        # Test service metrics analysis
-        start_time = time.time()
+        # Test service metrics analysis of the latest entry
+        start_time = time.perf_counter_ns()
         service_analysis = self.service_metrics.analyze_metrics(
-            self.service_metrics.get_recent_metrics()
+            self.service_metrics.get_metrics_history()[-1]
         )
-        service_analysis_time = time.time() - start_time
+        service_analysis_time = (time.perf_counter_ns() - start_time) / 1e9
         
-        # Test node metrics analysis
-        start_time = time.time()
+        # Test node metrics analysis of the latest entry
+        start_time = time.perf_counter_ns()
         node_analysis = self.node_metrics.analyze_metrics(
-            self.node_metrics.get_recent_metrics()
+            self.node_metrics.get_metrics_history()[-1]
         )
-        node_analysis_time = time.time() - start_time
+        node_analysis_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # Verify performance
         self.assertLess(service_analysis_time, 0.5)  # Should take less than 0.5 seconds
@@ -101,127 +90,144 @@ class TestMetricsPerformance(unittest.TestCase):
         # Verify analysis results
         self.assertIn('status', service_analysis)
         self.assertIn('health', service_analysis)
-        self.assertIn('trends', service_analysis)
         self.assertIn('alerts', service_analysis)
-        self.assertIn('statistics', service_analysis)
+        self.assertIn('recommendations', service_analysis)
+        self.assertIn('trends', node_analysis)
+        self.assertIn('statistics', node_analysis)
 
     def test_memory_usage(self):
         """Test memory usage of metrics collectors."""
         # Add large number of metrics
+        initial_memory = self.process.memory_info().rss
         num_metrics = 10000
-        for _ in range(num_metrics):
-            self.service_metrics.add_metrics(self.service_metrics_data)
-            self.node_metrics.add_metrics(self.node_metrics_data)
+        self.service_metrics.add_metrics_batch(self._batch(self.service_metrics_data, num_metrics))
+        self.node_metrics.add_metrics_batch(self._batch(self.node_metrics_data, num_metrics))
         
         # Get current memory usage
-        current_memory = psutil.Process().memory_info().rss
-        memory_increase = current_memory - self.initial_memory
+        current_memory = self.process.memory_info().rss
+        memory_increase = current_memory - initial_memory
         
         # Verify memory usage
         self.assertLess(memory_increase, 100 * 1024 * 1024)  # Should use less than 100MB
         
-        # Test cleanup
-        self.service_metrics._cleanup_old_metrics()
-        self.node_metrics._cleanup_old_metrics()
+        # Test cleanup of every entry
+        self.service_metrics.cleanup_old_metrics(timedelta(0))
+        self.node_metrics.cleanup_old_metrics(timedelta(0))
         
-        # Verify cleanup reduced memory usage
-        after_cleanup_memory = psutil.Process().memory_info().rss
-        self.assertLess(after_cleanup_memory, current_memory)
+        # Verify cleanup released the history; freed memory is not reliably returned to the OS
+        self.assertEqual(self.service_metrics.get_metrics_history(), [])
+        self.assertEqual(self.node_metrics.get_metrics_history(), [])
 
-    def test_concurrent_metrics_collection(self):
+    async def test_concurrent_metrics_collection(self):
         """Test concurrent metrics collection performance."""
-        async def collect_metrics(collector, metrics_data, num_metrics):
-            for _ in range(num_metrics):
-                collector.add_metrics(metrics_data)
-                await asyncio.sleep(0)  # Allow other tasks to run
+        batch_size = 100
+        
+        async def produce_metrics(queue, collector, metrics_data, num_metrics):
+            for _ in range(0, num_metrics, batch_size):
+                await queue.put((collector, self._batch(metrics_data, batch_size)))
+        
+        async def consume_metrics(queue):
+            while True:
+                collector, batch = await queue.get()
+                collector.add_metrics_batch(batch)
+                queue.task_done()
+        
+        async def feed_metrics(queue, num_metrics):
+            await asyncio.gather(
+                produce_metrics(queue, self.service_metrics, self.service_metrics_data, num_metrics),
+                produce_metrics(queue, self.node_metrics, self.node_metrics_data, num_metrics)
+            )
+            await queue.join()
+        
+        async def collect_concurrently(num_metrics):
+            queue = asyncio.Queue(maxsize=64)
+            consumer = asyncio.ensure_future(consume_metrics(queue))
+            feeder = asyncio.ensure_future(feed_metrics(queue, num_metrics))
+            
+            # A failing consumer would leave the feeder waiting on the queue forever
+            done, pending = await asyncio.wait((feeder, consumer), return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            for task in done:
+                task.result()
         
         # Test concurrent collection
         num_metrics = 1000
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         # Run concurrent collection
-        loop = asyncio.get_event_loop()
-        tasks = [
-            collect_metrics(self.service_metrics, self.service_metrics_data, num_metrics),
-            collect_metrics(self.node_metrics, self.node_metrics_data, num_metrics)
-        ]
-        loop.run_until_complete(asyncio.gather(*tasks))
+        await collect_concurrently(num_metrics)
         
-        end_time = time.time()
-        collection_time = end_time - start_time
+        collection_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # Verify performance
         self.assertLess(collection_time, 2.0)  # Should take less than 2 seconds
-        self.assertEqual(len(self.service_metrics.get_recent_metrics()), num_metrics)
-        self.assertEqual(len(self.node_metrics.get_recent_metrics()), num_metrics)
+        self.assertEqual(len(self.service_metrics.get_metrics_history()), num_metrics)
+        self.assertEqual(len(self.node_metrics.get_metrics_history()), num_metrics)
 
     def test_metrics_cleanup_performance(self):
         """Test performance of metrics cleanup."""
-        # Add metrics with different timestamps
+        # Add metrics with timestamps spread over the last hour, newest first
         num_metrics = 1000
-        for i in range(num_metrics):
-            # Add metrics with timestamps spread over the last hour
-            timestamp = datetime.now() - timedelta(minutes=i/num_metrics * 60)
-            service_metrics = self.service_metrics_data.copy()
-            node_metrics = self.node_metrics_data.copy()
-            service_metrics['timestamp'] = timestamp
-            node_metrics['timestamp'] = timestamp
-            
-            self.service_metrics.add_metrics(service_metrics)
-            self.node_metrics.add_metrics(node_metrics)
+        offsets = np.arange(num_metrics) * np.timedelta64(3600 * 10**6 // num_metrics, 'us')
+        timestamps = np.datetime64(datetime.now(), 'us') - offsets
+        
+        self.service_metrics.add_metrics_batch(
+            self._batch(self.service_metrics_data, num_metrics, timestamp=timestamps)
+        )
+        self.node_metrics.add_metrics_batch(
+            self._batch(self.node_metrics_data, num_metrics, timestamp=timestamps)
+        )
         
         # Test cleanup performance
-        start_time = time.time()
-        self.service_metrics._cleanup_old_metrics()
-        self.node_metrics._cleanup_old_metrics()
-        cleanup_time = time.time() - start_time
+        start_time = time.perf_counter_ns()
+        self.service_metrics.cleanup_old_metrics(timedelta(minutes=30))
+        self.node_metrics.cleanup_old_metrics(timedelta(minutes=30))
+        cleanup_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # Verify performance
         self.assertLess(cleanup_time, 0.5)  # Should take less than 0.5 seconds
         
         # Verify cleanup results
-        recent_metrics = self.service_metrics.get_recent_metrics()
+        recent_metrics = self.service_metrics.get_metrics_history()
         self.assertLess(len(recent_metrics), num_metrics)  # Should have cleaned up old metrics
 
     def test_alert_generation_performance(self):
         """Test performance of alert generation."""
         # Add metrics with varying values to trigger alerts
         num_metrics = 1000
-        for i in range(num_metrics):
-            # Vary metrics to trigger different alerts
-            service_metrics = self.service_metrics_data.copy()
-            node_metrics = self.node_metrics_data.copy()
-            
-            service_metrics['cpu_usage'] = 50 + (i % 50)  # Vary between 50-100%
-            service_metrics['error_rate'] = 0.01 + (i % 10) * 0.01  # Vary between 1-10%
-            node_metrics['temperature'] = 60 + (i % 30)  # Vary between 60-90°C
-            
-            self.service_metrics.add_metrics(service_metrics)
-            self.node_metrics.add_metrics(node_metrics)
-        
-        # Test alert generation performance
-        start_time = time.time()
-        service_alerts = self.service_metrics._generate_alerts(
-            self.service_metrics._calculate_statistics(
-                self.service_metrics._extract_numeric_values(
-                    self.service_metrics.get_recent_metrics()
-                )
-            ),
-            self.service_metrics._analyze_trends(
-                self.service_metrics.get_recent_metrics()
+        index = np.arange(num_metrics)
+        
+        self.service_metrics.add_metrics_batch(
+            self._batch(
+                self.service_metrics_data,
+                num_metrics,
+                cpu_usage=50.0 + index % 50,  # Vary between 50-100%
+                error_rate=0.01 + (index % 10) * 0.01  # Vary between 1-10%
             )
         )
-        node_alerts = self.node_metrics._generate_alerts(
-            self.node_metrics._calculate_statistics(
-                self.node_metrics._extract_numeric_values(
-                    self.node_metrics.get_recent_metrics()
-                )
-            ),
-            self.node_metrics._analyze_trends(
-                self.node_metrics.get_recent_metrics()
+        self.node_metrics.add_metrics_batch(
+            self._batch(
+                self.node_metrics_data,
+                num_metrics,
+                cpu_usage=50.0 + index % 50,  # Vary between 50-100%
+                temperature=60.0 + index % 30  # Vary between 60-90°C
             )
         )
-        alert_time = time.time() - start_time
+        
+        # Test alert generation performance across every entry
+        start_time = time.perf_counter_ns()
+        service_alerts = [
+            alert
+            for metrics in self.service_metrics.get_metrics_history()
+            for alert in self.service_metrics.analyze_metrics(metrics)['alerts']
+        ]
+        node_alerts = [
+            alert
+            for metrics in self.node_metrics.get_metrics_history()
+            for alert in self.node_metrics.analyze_metrics(metrics)['alerts']
+        ]
+        alert_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # Verify performance
         self.assertLess(alert_time, 0.5)  # Should take less than 0.5 seconds
@@ -230,10 +236,5 @@ class TestMetricsPerformance(unittest.TestCase):
         self.assertGreater(len(service_alerts), 0)
         self.assertGreater(len(node_alerts), 0)
 
-def run_async_test(coro):
-    """Helper function to run async tests."""
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(coro)
-
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -1,141 +1,91 @@
 #!/usr/bin/env python3
 
-import unittest
-from unittest.mock import Mock, patch
-from datetime import datetime
-from src.nodes import NodeManager, NodeDefinition
+import pytest
+from src.nodes import NodeDefinition
 
-class TestNodeManager(unittest.TestCase):
-    """Test cases for the NodeManager class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_client = Mock()
-        self.node_manager = NodeManager(self.mock_client)
-        
-        # Sample valid node data
-        self.valid_node_data = {
-            'id': 'node1',
-            'org_id': 'examples',
-            'pattern': 'pattern1',
-            'name': 'Test Node',
-            'nodeType': 'device',
-            'publicKey': 'key123',
-            'token': 'token123',
-            'registeredServices': [],
-            'policy': {}
-        }
+def test_validate_node_data_valid(node_manager, valid_node_data):
+    """Test validation of valid node data."""
+    assert node_manager.validate_node_data(valid_node_data)
+
+@pytest.mark.parametrize("mutation,error", [
+    (lambda data: data.pop('id'), 'Field required'),
+    (lambda data: data.__setitem__('nodeType', 'invalid_type'), 'Invalid node type'),
+    (lambda data: data.__setitem__('registeredServices', 'not_a_list'), 'Input should be a valid list'),
+    (lambda data: data.__setitem__('policy', 'not_a_dict'), 'Input should be a valid dictionary'),
+], ids=['missing_field', 'invalid_type', 'invalid_services', 'invalid_policy'])
+def test_validate_node_data_invalid(node_manager, valid_node_data, mutation, error):
+    """Test validation of node data with a missing or invalid field."""
+    mutation(valid_node_data)
     
-    def test_validate_node_data_valid(self):
-        """Test validation of valid node data."""
-        self.assertTrue(self.node_manager.validate_node_data(self.valid_node_data))
+    with pytest.raises(ValueError, match=error):
+        node_manager.validate_node_data(valid_node_data)
+
+def test_register_node(node_manager, node_client, valid_node_data):
+    """Test node registration with validation."""
+    node_client.create_node.return_value = {'status': 'registered'}
     
-    def test_validate_node_data_missing_field(self):
-        """Test validation of node data with missing required field."""
-        invalid_data = self.valid_node_data.copy()
-        del invalid_data['id']
-        
-        with self.assertRaises(ValueError) as context:
-            self.node_manager.validate_node_data(invalid_data)
-        
-        self.assertIn('Field required', str(context.exception))
+    result = node_manager.register_node('examples', valid_node_data)
     
-    def test_validate_node_data_invalid_type(self):
-        """Test validation of node data with invalid node type."""
-        invalid_data = self.valid_node_data.copy()
-        invalid_data['nodeType'] = 'invalid_type'
-        
-        with self.assertRaises(ValueError) as context:
-            self.node_manager.validate_node_data(invalid_data)
-        
-        self.assertIn('Invalid node type', str(context.exception))
+    assert result == {'status': 'registered'}
+    node_client.create_node.assert_called_once_with('examples', valid_node_data)
+
+def test_get_node(node_manager, node_client, valid_node_data):
+    """Test retrieving a node."""
+    node_client.get_node.return_value = valid_node_data
     
-    def test_validate_node_data_invalid_services(self):
-        """Test validation of node data with invalid services format."""
-        invalid_data = self.valid_node_data.copy()
-        invalid_data['registeredServices'] = 'not_a_list'
-        
-        with self.assertRaises(ValueError) as context:
-            self.node_manager.validate_node_data(invalid_data)
-        
-        self.assertIn('Input should be a valid list', str(context.exception))
+    result = node_manager.get_node('examples', 'node1')
     
-    def test_validate_node_data_invalid_policy(self):
-        """Test validation of node data with invalid policy format."""
-        invalid_data = self.valid_node_data.copy()
-        invalid_data['policy'] = 'not_a_dict'
-        
-        with self.assertRaises(ValueError) as context:
-            self.node_manager.validate_node_data(invalid_data)
-        
-        self.assertIn('Input should be a valid dictionary', str(context.exception))
+    assert isinstance(result, NodeDefinition)
+    assert result.id == valid_node_data['id']
+    assert result.org_id == valid_node_data['org_id']
+    assert result.nodeType == valid_node_data['nodeType']
+    node_client.get_node.assert_called_once_with('examples', 'node1')
+
+def test_update_node(node_manager, node_client, valid_node_data):
+    """Test updating a node with validation."""
+    node_client.update_node.return_value = {'status': 'updated'}
     
-    def test_register_node(self):
-        """Test node registration with validation."""
-        self.mock_client.create_node.return_value = {'status': 'registered'}
-        
-        result = self.node_manager.register_node('examples', self.valid_node_data)
-        
-        self.assertEqual(result, {'status': 'registered'})
-        self.mock_client.create_node.assert_called_once_with('examples', self.valid_node_data)
+    result = node_manager.update_node('examples', 'node1', valid_node_data)
     
-    def test_get_node(self):
-        """Test retrieving a node."""
-        self.mock_client.get_node.return_value = self.valid_node_data
-        
-        result = self.node_manager.get_node('examples', 'node1')
-        
-        self.assertIsInstance(result, NodeDefinition)
-        self.assertEqual(result.id, self.valid_node_data['id'])
-        self.assertEqual(result.org_id, self.valid_node_data['org_id'])
-        self.assertEqual(result.nodeType, self.valid_node_data['nodeType'])
-        self.mock_client.get_node.assert_called_once_with('examples', 'node1')
+    assert result == {'status': 'updated'}
+    node_client.update_node.assert_called_once_with('examples', 'node1', valid_node_data)
+
+def test_delete_node(node_manager, node_client):
+    """Test deleting a node."""
+    node_client.delete_node.return_value = {'status': 'deleted'}
     
-    def test_update_node(self):
-        """Test updating a node with validation."""
-        self.mock_client.update_node.return_value = {'status': 'updated'}
-        
-        result = self.node_manager.update_node('examples', 'node1', self.valid_node_data)
-        
-        self.assertEqual(result, {'status': 'updated'})
-        self.mock_client.update_node.assert_called_once_with('examples', 'node1', self.valid_node_data)
+    result = node_manager.delete_node('examples', 'node1')
     
-    def test_delete_node(self):
-        """Test deleting a node."""
-        self.mock_client.delete_node.return_value = {'status': 'deleted'}
-        
-        result = self.node_manager.delete_node('examples', 'node1')
-        
-        self.assertEqual(result, {'status': 'deleted'})
-        self.mock_client.delete_node.assert_called_once_with('examples', 'node1')
+    assert result == {'status': 'deleted'}
+    node_client.delete_node.assert_called_once_with('examples', 'node1')
+
+def test_get_node_status(node_manager, node_client):
+    """Test retrieving node status."""
+    node_client.get_node.return_value = {
+        'id': 'node1',
+        'org_id': 'examples',
+        'lastHeartbeat': '2024-01-01T00:00:00',
+        'lastUpdated': '2024-01-01T00:00:00',
+        'registeredServices': [],
+        'policy': {}
+    }
     
-    def test_get_node_status(self):
-        """Test retrieving node status."""
-        self.mock_client.get_node.return_value = {
-            'id': 'node1',
-            'org_id': 'examples',
-            'lastHeartbeat': datetime.now(),
-            'lastUpdated': datetime.now(),
-            'registeredServices': [],
-            'policy': {}
-        }
-        
-        result = self.node_manager.get_node_status('examples', 'node1')
-        
-        self.assertIn('lastHeartbeat', result)
-        self.assertIn('lastUpdated', result)
-        self.assertIn('registeredServices', result)
-        self.assertIn('policy', result)
-        self.mock_client.get_node.assert_called_once_with('examples', 'node1')
+    result = node_manager.get_node_status('examples', 'node1')
     
-    def test_from_api_response(self):
-        """Test creating NodeDefinition from API response."""
-        node = NodeDefinition.from_api_response(self.valid_node_data)
-        self.assertEqual(node.id, self.valid_node_data['id'])
-        self.assertEqual(node.org_id, self.valid_node_data['org_id'])
-        self.assertEqual(node.nodeType, self.valid_node_data['nodeType'])
-        self.assertEqual(node.registeredServices, self.valid_node_data['registeredServices'])
-        self.assertEqual(node.policy, self.valid_node_data['policy'])
+    assert 'lastHeartbeat' in result
+    assert 'lastUpdated' in result
+    assert 'registeredServices' in result
+    assert 'policy' in result
+    node_client.get_node.assert_called_once_with('examples', 'node1')
+
+def test_from_api_response(valid_node_data):
+    """Test creating NodeDefinition from API response."""
+    node = NodeDefinition.from_api_response(valid_node_data)
+    assert node.id == valid_node_data['id']
+    assert node.org_id == valid_node_data['org_id']
+    assert node.nodeType == valid_node_data['nodeType']
+    assert node.registeredServices == valid_node_data['registeredServices']
+    assert node.policy == valid_node_data['policy']
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    pytest.main([__file__])
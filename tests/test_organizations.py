@@ -1,48 +1,50 @@
 import pytest
+from dataclasses import dataclass
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock
 
 from src.organizations import OrganizationManager, OrganizationInfo, User, PermissionError, PermissionLevel
-from src.exchange_client import ExchangeAPIClient
 
+@dataclass(frozen=True)
 class MockResponse:
-    def __init__(self, json_data, status_code=200):
-        self._json_data = json_data
-        self.status_code = status_code
+    json_data: Any
+    status_code: int = 200
     def json(self):
-        return self._json_data
+        return self.json_data
 
-@pytest.fixture
-def mock_client():
-    client = MagicMock(spec=ExchangeAPIClient)
-    client.org_id = "test-org"
-    client.get = AsyncMock()
-    client.post = AsyncMock()
-    client.delete = AsyncMock()
-    return client
+# Responses are immutable, so the fixed error response is shared by all tests
+FORBIDDEN_RESPONSE = MockResponse({}, status_code=403)
+
+# Timestamp shared by all sample API payloads
+_NOW = datetime.now().isoformat()
+
+@pytest.fixture(scope="module")
+def mock_client(make_stub_client):
+    return make_stub_client(AsyncMock, "get", "post", "put", "delete")
 
 @pytest.fixture
 def org_manager(mock_client):
     return OrganizationManager(mock_client)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_org_data():
     return {
         "org_id": "test-org",
         "name": "TestOrg",
         "description": "Test organization description",
-        "created": datetime.now().isoformat(),
-        "last_updated": datetime.now().isoformat()
+        "created": _NOW,
+        "last_updated": _NOW
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_user_data():
     return {
         "username": "test-user",
         "org_id": "test-org",
         "roles": ["user"],
-        "created": datetime.now().isoformat(),
-        "last_updated": datetime.now().isoformat()
+        "created": _NOW,
+        "last_updated": _NOW
     }
 
 @pytest.mark.asyncio
@@ -69,7 +71,7 @@ async def test_create_organization(org_manager, mock_client, sample_org_data):
 
 @pytest.mark.asyncio
 async def test_create_organization_permission_error(org_manager, mock_client):
-    mock_client.post.return_value = MockResponse({}, status_code=403)
+    mock_client.post.return_value = FORBIDDEN_RESPONSE
     with pytest.raises(PermissionError):
         await org_manager.create_organization("NewOrg", "Test description")
 
@@ -81,18 +83,17 @@ async def test_create_user(org_manager, mock_client, sample_user_data):
     mock_client.post.assert_called_once_with("/v1/orgs/test-org/users", json={"username": "test-user", "roles": ["user"]})
 
 @pytest.mark.asyncio
-async def test_create_user_with_elevated_permissions(org_manager, mock_client, sample_user_data):
+async def test_create_user_with_elevated_permissions(org_manager, mock_client):
     # Provide all required fields for the current user
-    now = datetime.now().isoformat()
     mock_current_user = {
         "username": "admin_user",
         "org_id": "test-org",
         "roles": ["super_admin"],
-        "created": now,
-        "last_updated": now
+        "created": _NOW,
+        "last_updated": _NOW
     }
     mock_client.get.return_value = MockResponse(mock_current_user)
-    mock_client.post.return_value = MockResponse({"username": "new_admin", "org_id": "test-org", "roles": ["admin"], "created": now, "last_updated": now})
+    mock_client.post.return_value = MockResponse({"username": "new_admin", "org_id": "test-org", "roles": ["admin"], "created": _NOW, "last_updated": _NOW})
     user = await org_manager.create_user("test-org", "new_admin", ["admin"])
     assert user.username == "new_admin"
     assert mock_client.get.call_count == 1
@@ -100,7 +101,7 @@ async def test_create_user_with_elevated_permissions(org_manager, mock_client, s
 
 @pytest.mark.asyncio
 async def test_create_user_permission_error(org_manager, mock_client):
-    mock_client.post.return_value = MockResponse({}, status_code=403)
+    mock_client.post.return_value = FORBIDDEN_RESPONSE
     with pytest.raises(PermissionError):
         await org_manager.create_user("test-org", "test-user", ["user"])
 
@@ -112,7 +113,7 @@ async def test_delete_organization(org_manager, mock_client):
 
 @pytest.mark.asyncio
 async def test_delete_organization_permission_error(org_manager, mock_client):
-    mock_client.delete.return_value = MockResponse({}, status_code=403)
+    mock_client.delete.return_value = FORBIDDEN_RESPONSE
     with pytest.raises(Exception):
         await org_manager.delete_organization("test-org")
 
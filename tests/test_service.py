@@ -1,22 +1,21 @@
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, call
 
 from openhorizon_client.service import ServiceInfo, ServiceManager, ServiceListType
-from openhorizon_client.client import ExchangeAPIClient
 
-@pytest.fixture
-def mock_client():
-    client = MagicMock(spec=ExchangeAPIClient)
-    client.org_id = "test-org"
-    client._make_request = AsyncMock()
-    return client
+# Fixed timestamp for services whose update time the tests don't check
+_LAST_UPDATED = datetime(2024, 3, 20, 12, 0)
+
+@pytest.fixture(scope="module")
+def mock_client(make_stub_client):
+    return make_stub_client(AsyncMock, "_make_request")
 
 @pytest.fixture
 def service_manager(mock_client):
     return ServiceManager(mock_client)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_service_data():
     return {
         "id": "test-service",
@@ -30,68 +29,47 @@ def sample_service_data():
         "metadata": {"description": "Test service"}
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_service(sample_service_data):
     return ServiceInfo.from_api_response(sample_service_data)
 
-async def test_get_service_list(service_manager, mock_client, sample_service_data):
-    mock_client._make_request.return_value = [sample_service_data]
-    
-    services = await service_manager.get_service_list(ServiceListType.CATALOG)
-    
-    assert len(services) == 1
-    assert services[0].id == sample_service_data["id"]
-    assert services[0].name == sample_service_data["name"]
-    mock_client._make_request.assert_called_once_with(
-        "GET",
-        "/catalog/services"
+def _service(id, name, owner, **overrides):
+    fields = dict(
+        version="1.0.0",
+        arch="amd64",
+        public=True,
+        state="active",
+        last_updated=_LAST_UPDATED,
+        metadata={}
     )
+    fields.update(overrides)
+    return ServiceInfo(id=id, name=name, owner=owner, **fields)
 
-async def test_get_user_services(service_manager, mock_client, sample_service_data):
-    mock_client._make_request.return_value = [sample_service_data]
-    
-    services = await service_manager.get_user_services("test-user")
-    
-    assert len(services) == 1
-    assert services[0].owner == "test-user"
-    mock_client._make_request.assert_called_once_with(
-        "GET",
-        "/orgs/test-org/users/test-user/services"
-    )
+@pytest.fixture(scope="module")
+def unsorted_services():
+    return [
+        _service("service1", "Service A", "user1"),
+        _service("service2", "Service B", "user2")
+    ]
 
-async def test_get_public_services(service_manager, mock_client, sample_service_data):
+@pytest.mark.parametrize("method,args,expected_path", [
+    ("get_service_list", (ServiceListType.CATALOG,), "/catalog/services"),
+    ("get_user_services", ("test-user",), "/orgs/test-org/users/test-user/services"),
+    ("get_public_services", (), "/orgs/test-org/services?public=true"),
+    ("get_org_services", (), "/orgs/test-org/services?available=true"),
+    ("get_node_services", ("test-node",), "/orgs/test-org/nodes/test-node/services"),
+])
+async def test_list_services(service_manager, mock_client, sample_service_data, method, args, expected_path):
     mock_client._make_request.return_value = [sample_service_data]
     
-    services = await service_manager.get_public_services()
+    services = await getattr(service_manager, method)(*args)
     
     assert len(services) == 1
+    assert services[0].id == sample_service_data["id"]
+    assert services[0].name == sample_service_data["name"]
+    assert services[0].owner == "test-user"
     assert services[0].public is True
-    mock_client._make_request.assert_called_once_with(
-        "GET",
-        "/orgs/test-org/services?public=true"
-    )
-
-async def test_get_org_services(service_manager, mock_client, sample_service_data):
-    mock_client._make_request.return_value = [sample_service_data]
-    
-    services = await service_manager.get_org_services()
-    
-    assert len(services) == 1
-    mock_client._make_request.assert_called_once_with(
-        "GET",
-        "/orgs/test-org/services?available=true"
-    )
-
-async def test_get_node_services(service_manager, mock_client, sample_service_data):
-    mock_client._make_request.return_value = [sample_service_data]
-    
-    services = await service_manager.get_node_services("test-node")
-    
-    assert len(services) == 1
-    mock_client._make_request.assert_called_once_with(
-        "GET",
-        "/orgs/test-org/nodes/test-node/services"
-    )
+    assert mock_client._make_request.mock_calls == [call("GET", expected_path)]
 
 def test_filter_services(service_manager, sample_service):
     services = [sample_service]
@@ -102,37 +80,12 @@ def test_filter_services(service_manager, sample_service):
     filtered = service_manager.filter_services(services, public=False)
     assert len(filtered) == 0
 
-def test_sort_services(service_manager, sample_service):
-    services = [
-        ServiceInfo(
-            id="service1",
-            name="Service A",
-            owner="user1",
-            version="1.0.0",
-            arch="amd64",
-            public=True,
-            state="active",
-            last_updated=datetime.now(),
-            metadata={}
-        ),
-        ServiceInfo(
-            id="service2",
-            name="Service B",
-            owner="user2",
-            version="1.0.0",
-            arch="amd64",
-            public=True,
-            state="active",
-            last_updated=datetime.now(),
-            metadata={}
-        )
-    ]
-    
-    sorted_services = service_manager.sort_services(services, "name")
+def test_sort_services(service_manager, unsorted_services):
+    sorted_services = service_manager.sort_services(unsorted_services, "name")
     assert sorted_services[0].name == "Service A"
     assert sorted_services[1].name == "Service B"
     
-    sorted_services = service_manager.sort_services(services, "name", reverse=True)
+    sorted_services = service_manager.sort_services(unsorted_services, "name", reverse=True)
     assert sorted_services[0].name == "Service B"
     assert sorted_services[1].name == "Service A"
 
@@ -143,10 +96,9 @@ async def test_get_service(service_manager, mock_client, sample_service_data):
     
     assert service is not None
     assert service.id == "test-service"
-    mock_client._make_request.assert_called_once_with(
-        "GET",
-        "/orgs/test-org/services/test-service"
-    )
+    assert mock_client._make_request.mock_calls == [
+        call("GET", "/orgs/test-org/services/test-service")
+    ]
 
 async def test_get_service_not_found(service_manager, mock_client):
     mock_client._make_request.side_effect = Exception("Service not found")
@@ -5,13 +5,17 @@ import pytest
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 from src.ai.service_agent import ServiceManagementAgent
+from src.ai.service_metrics import ServiceMetricsCollector
 
-@pytest.fixture
-def mock_client():
-    """Create a mock ExchangeAPIClient."""
-    client = MagicMock()
-    client.org_id = 'test-org'
-    return client
+@pytest.fixture(scope="module")
+def mock_client(make_stub_client):
+    """Create a stub ExchangeAPIClient shared by the tests in this module."""
+    return make_stub_client(MagicMock, 'get_services', 'get_service', 'update_service')
+
+@pytest.fixture(autouse=True)
+def _client_defaults(mock_client):
+    """Make client updates succeed unless a test overrides them."""
+    mock_client.update_service.return_value = {'status': 'success'}
 
 @pytest.fixture
 def service_agent(mock_client):
@@ -22,7 +26,7 @@ def test_init(service_agent, mock_client):
     """Test initialization of ServiceManagementAgent."""
     assert service_agent.client == mock_client
     assert service_agent._deployment_history == []
-    assert isinstance(service_agent.metrics_collector, ServiceManagementAgent.metrics_collector.__class__)
+    assert isinstance(service_agent.metrics_collector, ServiceMetricsCollector)
 
 @pytest.mark.asyncio
 async def test_analyze_no_services(service_agent, mock_client):
@@ -79,12 +83,15 @@ async def test_analyze_with_services(service_agent, mock_client):
         assert len(analysis['recommendations']) == 2
         assert len(analysis['alerts']) == 2
 
-def test_determine_action(service_agent):
+@pytest.mark.parametrize('recommendation,expected', (
+    ('Consider scaling up CPU resources', 'scale'),
+    ('Update service configuration', 'update'),
+    ('Restart the service', 'restart'),
+    ('Investigate performance issues', 'investigate'),
+))
+def test_determine_action(service_agent, recommendation, expected):
     """Test determining action from recommendation."""
-    assert service_agent._determine_action('Consider scaling up CPU resources') == 'scale'
-    assert service_agent._determine_action('Update service configuration') == 'update'
-    assert service_agent._determine_action('Restart the service') == 'restart'
-    assert service_agent._determine_action('Investigate performance issues') == 'investigate'
+    assert service_agent._determine_action(recommendation) == expected
 
 @pytest.mark.asyncio
 async def test_act_invalid_action(service_agent):
@@ -105,9 +112,6 @@ async def test_act_scale(service_agent, mock_client):
         }
     }
     
-    # Mock update service
-    mock_client.update_service.return_value = {'status': 'success'}
-    
     action = {
         'service_id': 'test-service',
         'action': 'scale',
@@ -126,9 +130,6 @@ async def test_act_scale(service_agent, mock_client):
 @pytest.mark.asyncio
 async def test_act_update(service_agent, mock_client):
     """Test updating a service."""
-    # Mock update service
-    mock_client.update_service.return_value = {'status': 'success'}
-    
     action = {
         'service_id': 'test-service',
         'action': 'update',
@@ -151,9 +152,6 @@ async def test_act_restart(service_agent, mock_client):
     # Mock service data
     mock_client.get_service.return_value = {'config': 'value'}
     
-    # Mock update service
-    mock_client.update_service.return_value = {'status': 'success'}
-    
     action = {
         'service_id': 'test-service',
         'action': 'restart'
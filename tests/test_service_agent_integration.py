@@ -1,225 +1,206 @@
-import unittest
-from datetime import datetime, timedelta
-import os
 import asyncio
-from unittest.mock import patch, MagicMock
-from src.ai.service_agent import ServiceManagementAgent
-from src.exchange.client import ExchangeAPIClient
-
-class TestServiceAgentIntegration(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        """Set up test environment with API client and service agent."""
-        # Initialize API client with test credentials
-        cls.client = ExchangeAPIClient(
-            base_url=os.getenv("EXCHANGE_URL", "http://localhost:8080"),
-            org=os.getenv("EXCHANGE_ORG", "testorg"),
-            username=os.getenv("EXCHANGE_USERNAME", "testuser"),
-            password=os.getenv("EXCHANGE_PASSWORD", "testpass")
-        )
-        
-        # Initialize service agent
-        cls.service_agent = ServiceManagementAgent(cls.client)
-
-    def setUp(self):
-        """Set up test data and mocks before each test."""
-        # Sample service data from API
-        self.service_data = {
-            "id": "test-service",
-            "name": "Test Service",
-            "version": "1.0.0",
-            "status": "running",
-            "deployment": {
-                "resources": {
-                    "cpu": 1.0,
-                    "memory": 512.0
-                }
-            },
-            "metrics": {
-                "cpu_usage": 65.5,
-                "memory_usage": 72.3,
-                "error_rate": 0.03,
-                "response_time": 250.0
-            }
-        }
+import logging
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
 
-    @patch('src.exchange.client.ExchangeAPIClient.list_services')
-    async def test_service_analysis_integration(self, mock_list_services):
-        """Test integration of service analysis with API."""
-        # Mock API response
-        mock_list_services.return_value = {
-            "services": {
-                "test-service": self.service_data
-            }
-        }
-        
-        # Analyze services
-        analysis = await self.service_agent.analyze()
-        
-        # Verify analysis results
-        self.assertIn('services', analysis)
-        self.assertIn('recommendations', analysis)
-        self.assertIn('alerts', analysis)
-        
-        # Verify service analysis
-        service_analysis = analysis['services']['test-service']
-        self.assertIn('status', service_analysis)
-        self.assertIn('health', service_analysis)
-        self.assertIn('metrics', service_analysis)
-        self.assertIn('trends', service_analysis)
-
-    @patch('src.exchange.client.ExchangeAPIClient.get_service')
-    @patch('src.exchange.client.ExchangeAPIClient.update_service')
-    async def test_service_update_integration(self, mock_update_service, mock_get_service):
-        """Test integration of service update with API."""
-        # Mock API responses
-        mock_get_service.return_value = self.service_data
-        mock_update_service.return_value = {"status": "success"}
-        
-        # Create update action
-        action = {
-            'service_id': 'test-service',
-            'action': 'update',
-            'update_data': {
-                'deployment': {
-                    'resources': {
-                        'cpu': 2.0,
-                        'memory': 1024.0
-                    }
-                }
-            }
-        }
-        
-        # Execute update action
-        result = await self.service_agent.act(action)
-        
-        # Verify result
-        self.assertTrue(result)
-        mock_update_service.assert_called_once()
-
-    @patch('src.exchange.client.ExchangeAPIClient.get_service')
-    @patch('src.exchange.client.ExchangeAPIClient.update_service')
-    async def test_service_scale_integration(self, mock_update_service, mock_get_service):
-        """Test integration of service scaling with API."""
-        # Mock API responses
-        mock_get_service.return_value = self.service_data
-        mock_update_service.return_value = {"status": "success"}
-        
-        # Create scale action
-        action = {
-            'service_id': 'test-service',
-            'action': 'scale',
-            'scale_factor': 2.0
-        }
-        
-        # Execute scale action
-        result = await self.service_agent.act(action)
-        
-        # Verify result
-        self.assertTrue(result)
-        mock_update_service.assert_called_once()
-        
-        # Verify scaled resources
-        update_data = mock_update_service.call_args[0][2]
-        self.assertEqual(update_data['deployment']['resources']['cpu'], 2.0)
-        self.assertEqual(update_data['deployment']['resources']['memory'], 1024.0)
-
-    @patch('src.exchange.client.ExchangeAPIClient.get_service')
-    @patch('src.exchange.client.ExchangeAPIClient.update_service')
-    async def test_service_restart_integration(self, mock_update_service, mock_get_service):
-        """Test integration of service restart with API."""
-        # Mock API responses
-        mock_get_service.return_value = self.service_data
-        mock_update_service.return_value = {"status": "success"}
-        
-        # Create restart action
-        action = {
-            'service_id': 'test-service',
-            'action': 'restart'
-        }
-        
-        # Execute restart action
-        result = await self.service_agent.act(action)
-        
-        # Verify result
-        self.assertTrue(result)
-        mock_update_service.assert_called_once()
-        
-        # Verify same configuration was used
-        update_data = mock_update_service.call_args[0][2]
-        self.assertEqual(update_data, self.service_data)
-
-    @patch('src.exchange.client.ExchangeAPIClient.list_services')
-    async def test_service_metrics_collection_integration(self, mock_list_services):
-        """Test integration of service metrics collection with API."""
-        # Mock API response
-        mock_list_services.return_value = {
-            "services": {
-                "test-service": self.service_data
-            }
-        }
-        
-        # Analyze services to trigger metrics collection
-        analysis = await self.service_agent.analyze()
-        
-        # Verify metrics collection
-        service_analysis = analysis['services']['test-service']
-        metrics = service_analysis['metrics']
-        
-        self.assertEqual(metrics['cpu_usage'], 65.5)
-        self.assertEqual(metrics['memory_usage'], 72.3)
-        self.assertEqual(metrics['error_rate'], 0.03)
-        self.assertEqual(metrics['response_time'], 250.0)
-
-    @patch('src.exchange.client.ExchangeAPIClient.list_services')
-    async def test_service_alert_generation_integration(self, mock_list_services):
-        """Test integration of service alert generation with API."""
-        # Create service data with critical metrics
-        critical_service_data = self.service_data.copy()
-        critical_service_data['metrics'] = {
-            'cpu_usage': 95.0,
-            'memory_usage': 98.0,
-            'error_rate': 0.15,
-            'response_time': 2000.0
+# Longest a single event loop step may run before the test is failed as blocking
+BLOCKING_THRESHOLD = 0.05
+
+# Sample service data from API, shared read-only across tests
+BASE_SERVICE_DATA = {
+    "id": "test-service",
+    "name": "Test Service",
+    "version": "1.0.0",
+    "status": "running",
+    "deployment": {
+        "resources": {
+            "cpu": 1.0,
+            "memory": 512.0
         }
-        
-        # Mock API response
-        mock_list_services.return_value = {
-            "services": {
-                "test-service": critical_service_data
+    },
+    "metrics": {
+        "cpu_usage": 65.5,
+        "memory_usage": 72.3,
+        "error_rate": 0.03,
+        "response_time": 250.0
+    }
+}
+
+# The same service reporting critical metrics
+CRITICAL_SERVICE_DATA = {
+    **BASE_SERVICE_DATA,
+    "metrics": {
+        "cpu_usage": 95.0,
+        "memory_usage": 98.0,
+        "error_rate": 0.15,
+        "response_time": 2000.0
+    }
+}
+
+# Actions handed to the agent; act() only reads them
+UPDATE_ACTION = {
+    "service_id": "test-service",
+    "action": "update",
+    "update_data": {
+        "deployment": {
+            "resources": {
+                "cpu": 2.0,
+                "memory": 1024.0
             }
         }
-        
-        # Analyze services to trigger alert generation
-        analysis = await self.service_agent.analyze()
-        
-        # Verify alerts
-        self.assertGreater(len(analysis['alerts']), 0)
-        
-        # Verify recommendations
-        self.assertGreater(len(analysis['recommendations']), 0)
-        recommendation = analysis['recommendations'][0]
-        self.assertEqual(recommendation['service_id'], 'test-service')
-        self.assertIn(recommendation['action'], ['update', 'scale', 'restart'])
-
-    @patch('src.exchange.client.ExchangeAPIClient.list_services')
-    async def test_service_error_handling_integration(self, mock_list_services):
-        """Test integration of service error handling with API."""
-        # Mock API error response
-        mock_list_services.side_effect = Exception("API Error")
-        
-        # Analyze services
-        analysis = await self.service_agent.analyze()
-        
-        # Verify error handling
-        self.assertEqual(analysis['services'], {})
-        self.assertEqual(analysis['recommendations'], [])
-        self.assertEqual(analysis['alerts'], [])
-
-def run_async_test(coro):
-    """Helper function to run async tests."""
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(coro)
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    }
+}
+
+SCALE_ACTION = {
+    "service_id": "test-service",
+    "action": "scale",
+    "scale_factor": 2.0
+}
+
+RESTART_ACTION = {
+    "service_id": "test-service",
+    "action": "restart"
+}
+
+@pytest_asyncio.fixture(loop_scope="module", autouse=True)
+async def fail_on_blocking_calls(caplog):
+    """Fail the test if any event loop step blocks for longer than BLOCKING_THRESHOLD.
+    
+    Relies on asyncio debug mode, which logs every callback that runs
+    longer than the loop's slow_callback_duration.
+    """
+    loop = asyncio.get_running_loop()
+    debug, threshold = loop.get_debug(), loop.slow_callback_duration
+    loop.set_debug(True)
+    loop.slow_callback_duration = BLOCKING_THRESHOLD
+    with caplog.at_level(logging.WARNING, logger="asyncio"):
+        yield
+    loop.set_debug(debug)
+    loop.slow_callback_duration = threshold
+    
+    blocking = [
+        record.getMessage() for record in caplog.get_records("call")
+        if record.name == "asyncio" and record.getMessage().startswith("Executing ")
+    ]
+    if blocking:
+        pytest.fail("Event loop blocked:\n" + "\n".join(blocking))
+
+@pytest.fixture(autouse=True)
+def reported_metrics(service_agent):
+    """Collect the metrics each service reports instead of probing host processes."""
+    with patch.object(
+        service_agent.metrics_collector, '_collect_entity_metrics',
+        side_effect=lambda service_id, service_data: dict(service_data['metrics'])
+    ):
+        yield
+
+@pytest.fixture
+def healthy_service(exchange_client):
+    """Serve the healthy test service from the mock client."""
+    exchange_client.get_services.return_value = [BASE_SERVICE_DATA]
+    exchange_client.get_service.return_value = BASE_SERVICE_DATA
+    exchange_client.update_service.return_value = {"status": "success"}
+
+@pytest.fixture
+def critical_service(exchange_client):
+    """Serve the test service reporting critical metrics from the mock client."""
+    exchange_client.get_services.return_value = [CRITICAL_SERVICE_DATA]
+    exchange_client.get_service.return_value = CRITICAL_SERVICE_DATA
+
+async def test_service_analysis_integration(healthy_service, service_agent, exchange_client):
+    """Test integration of service analysis with API."""
+    # Analyze services
+    analysis = await service_agent.analyze()
+    
+    # Verify analysis results
+    assert 'services' in analysis
+    assert 'recommendations' in analysis
+    assert 'alerts' in analysis
+    
+    # Verify service analysis
+    service_analysis = analysis['services']['test-service']
+    assert 'status' in service_analysis
+    assert 'health' in service_analysis
+    assert 'metrics' in service_analysis
+    assert 'alerts' in service_analysis
+    exchange_client.get_service.assert_called_once_with('test-service')
+
+async def test_service_update_integration(healthy_service, service_agent, exchange_client):
+    """Test integration of service update with API."""
+    # Execute update action
+    result = await service_agent.act(UPDATE_ACTION)
+    
+    # Verify result
+    assert result
+    exchange_client.update_service.assert_called_once_with(
+        exchange_client.org_id, 'test-service', UPDATE_ACTION['update_data']
+    )
+
+async def test_service_scale_integration(healthy_service, service_agent, exchange_client):
+    """Test integration of service scaling with API."""
+    # Execute scale action
+    result = await service_agent.act(SCALE_ACTION)
+    
+    # Verify result
+    assert result
+    exchange_client.update_service.assert_called_once()
+    
+    # Verify scaled resources
+    update_data = exchange_client.update_service.call_args[0][2]
+    assert update_data['deployment']['resources']['cpu'] == 2.0
+    assert update_data['deployment']['resources']['memory'] == 1024.0
+
+async def test_service_restart_integration(healthy_service, service_agent, exchange_client):
+    """Test integration of service restart with API."""
+    # Execute restart action
+    result = await service_agent.act(RESTART_ACTION)
+    
+    # Verify result
+    assert result
+    exchange_client.update_service.assert_called_once()
+    
+    # Verify same configuration was used
+    update_data = exchange_client.update_service.call_args[0][2]
+    assert update_data == BASE_SERVICE_DATA
+
+async def test_service_metrics_collection_integration(healthy_service, service_agent):
+    """Test integration of service metrics collection with API."""
+    # Analyze services to trigger metrics collection
+    analysis = await service_agent.analyze()
+    
+    # Verify metrics collection
+    service_analysis = analysis['services']['test-service']
+    metrics = service_analysis['metrics']
+    
+    assert metrics['cpu_usage'] == 65.5
+    assert metrics['memory_usage'] == 72.3
+    assert metrics['error_rate'] == 0.03
+    assert metrics['response_time'] == 250.0
+
+async def test_service_alert_generation_integration(critical_service, service_agent):
+    """Test integration of service alert generation with API."""
+    # Analyze services to trigger alert generation
+    analysis = await service_agent.analyze()
+    
+    # Verify alerts
+    assert len(analysis['alerts']) > 0
+    
+    # Verify recommendations
+    assert len(analysis['recommendations']) > 0
+    recommendation = analysis['recommendations'][0]
+    assert recommendation['service_id'] == 'test-service'
+    assert recommendation['action'] in ['update', 'scale', 'restart']
+
+async def test_service_error_handling_integration(service_agent, exchange_client):
+    """Test integration of service error handling with API."""
+    # Mock API error response
+    exchange_client.get_services.side_effect = Exception("API Error")
+    
+    # Analyze services
+    analysis = await service_agent.analyze()
+    
+    # Verify error handling
+    assert analysis['services'] == {}
+    assert analysis['recommendations'] == []
+    assert analysis['alerts'] == [{'type': 'error', 'message': 'Analysis failed: API Error'}]
@@ -2,12 +2,20 @@ import asyncio
 import os
 from datetime import datetime
 from typing import List
+import pytest
 from dotenv import load_dotenv
 
 from src.exchange.client import ExchangeAPIClient
 from openhorizon_client.service import ServiceManager, ServiceInfo, ServiceListType
 
-load_dotenv("config.env")
+# These tests talk to a live Exchange, so only run them when one is configured
+pytestmark = [
+    pytest.mark.skipif(
+        not os.getenv("HZN_EXCHANGE_URL"), reason="live endpoint tests disabled (HZN_EXCHANGE_URL not set)"
+    ),
+    pytest.mark.integration,
+    pytest.mark.serial,
+]
 
 # Extract username and password for use in the script, but do not overwrite HZN_EXCHANGE_USER_AUTH
 def get_username_password():
@@ -16,6 +24,24 @@ def get_username_password():
         return user_auth.split(":", 1)
     return user_auth, None
 
+@pytest.fixture
+def client() -> ExchangeAPIClient:
+    """Create an Exchange client from the HZN_* environment variables."""
+    return ExchangeAPIClient()
+
+@pytest.fixture
+def username() -> str:
+    """Username taken from HZN_EXCHANGE_USER_AUTH."""
+    return get_username_password()[0]
+
+@pytest.fixture
+def node_id() -> str:
+    """Node ID taken from HZN_NODE_ID."""
+    node_id = os.getenv("HZN_NODE_ID")
+    if not node_id:
+        pytest.skip("HZN_NODE_ID not set")
+    return node_id
+
 async def test_catalog_services(client: ExchangeAPIClient) -> List[ServiceInfo]:
     """Test retrieving services from the catalog."""
     manager = ServiceManager(client)
@@ -62,6 +88,8 @@ async def test_node_services(client: ExchangeAPIClient, node_id: str) -> List[Se
     return services
 
 async def main():
+    load_dotenv("config.env")
+    
     # Get credentials from environment variables
     org_id = os.getenv("HZN_ORG_ID")
     username, password = get_username_password()
@@ -75,38 +103,28 @@ async def main():
     # Create client
     client = ExchangeAPIClient()
     
-    try:
-        # Test catalog services
-        catalog_services = await test_catalog_services(client)
-        if not catalog_services:
-            print("Warning: No services found in catalog")
-        
-        # Test user services
-        user_services = await test_user_services(client, username)
-        if not user_services:
-            print("Warning: No services found for user")
-        
-        # Test public services
-        public_services = await test_public_services(client)
-        if not public_services:
-            print("Warning: No public services found")
-        
-        # Test organization services
-        org_services = await test_org_services(client)
-        if not org_services:
-            print("Warning: No organization services found")
-        
-        # Test node services (if we have a node ID)
-        node_id = os.getenv("HZN_NODE_ID")
-        if node_id:
-            node_services = await test_node_services(client, node_id)
-            if not node_services:
-                print("Warning: No services found on node")
-        else:
-            print("\nSkipping node services test (HZN_NODE_ID not set)")
-        
-    except Exception as e:
-        print(f"Error testing endpoints: {str(e)}")
+    # The endpoint checks are independent, so run their requests concurrently
+    checks = {
+        "catalog": test_catalog_services(client),
+        "user": test_user_services(client, username),
+        "public": test_public_services(client),
+        "organization": test_org_services(client),
+    }
+    
+    # Test node services (if we have a node ID)
+    node_id = os.getenv("HZN_NODE_ID")
+    if node_id:
+        checks["node"] = test_node_services(client, node_id)
+    else:
+        print("\nSkipping node services test (HZN_NODE_ID not set)")
+    
+    results = await asyncio.gather(*checks.values(), return_exceptions=True)
+    
+    for name, result in zip(checks, results):
+        if isinstance(result, Exception):
+            print(f"Error testing {name} services endpoint: {str(result)}")
+        elif not result:
+            print(f"Warning: No {name} services found")
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -1,156 +1,138 @@
 #!/usr/bin/env python3
 
-import unittest
-from unittest.mock import Mock, patch
-from datetime import datetime
+import pytest
+from types import MappingProxyType
+from unittest.mock import Mock
+from src.exchange_client import ExchangeAPIClient
 from src.services import ServiceManager, ServiceDefinition
 
-class TestServiceManager(unittest.TestCase):
-    """Test cases for the ServiceManager class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_client = Mock()
-        self.service_manager = ServiceManager(self.mock_client)
-        
-        # Sample valid service data
-        self.valid_service_data = {
-            'owner': 'test-org/test-user',
-            'label': 'Test Service',
-            'description': 'A test service',
-            'public': True,
-            'documentation': 'https://example.com/docs',
-            'url': 'test-service',
-            'version': '1.0.0',
-            'arch': 'amd64',
-            'sharable': 'singleton',
-            'matchHardware': {},
-            'requiredServices': [],
-            'userInput': [],
-            'deployment': {
-                'services': {
-                    'test-service': {
-                        'image': 'test-image:latest'
-                    }
-                }
-            },
-            'deploymentSignature': 'test-signature'
+# Sample valid service data, read-only so no test can change it for the others
+_VALID_SERVICE_DATA = MappingProxyType({
+    'owner': 'test-org/test-user',
+    'label': 'Test Service',
+    'description': 'A test service',
+    'public': True,
+    'documentation': 'https://example.com/docs',
+    'url': 'test-service',
+    'version': '1.0.0',
+    'arch': 'amd64',
+    'sharable': 'singleton',
+    'matchHardware': {},
+    'requiredServices': [],
+    'userInput': [],
+    'deployment': {
+        'services': {
+            'test-service': {
+                'image': 'test-image:latest'
+            }
         }
+    },
+    'deploymentSignature': 'test-signature'
+})
+
+# Service lists served by _ListServicesStub for the read-only search and version tests
+_SEARCHABLE_SERVICES = [
+    {'label': 'Test Service 1', 'description': 'First test service'},
+    {'label': 'Another Service', 'description': 'Second test service'},
+    {'label': 'Third Service', 'description': 'Not a test service'}
+]
+
+_VERSIONED_SERVICES = [
+    {'url': 'test-service', 'version': '1.0.0'},
+    {'url': 'test-service', 'version': '1.1.0'},
+    {'url': 'test-service', 'version': '2.0.0'},
+    {'url': 'other-service', 'version': '1.0.0'}
+]
+
+class _ListServicesStub:
+    """Minimal stand-in for an ExchangeAPIClient that only lists services."""
+    __slots__ = ("services", "orgs")
+    def __init__(self, services):
+        self.services = services
+        self.orgs = []
+    def list_services(self, org_id):
+        self.orgs.append(org_id)
+        return self.services
+
+@pytest.fixture
+def mock_client():
+    """Create a mock Exchange client for ServiceManager, limited to the real client's methods."""
+    return Mock(spec=ExchangeAPIClient)
+
+@pytest.fixture
+def service_manager(mock_client):
+    """Create a ServiceManager backed by the mock client."""
+    return ServiceManager(mock_client)
+
+@pytest.fixture
+def valid_service_data():
+    """Create a copy of the sample valid service data that tests may mutate."""
+    return dict(_VALID_SERVICE_DATA)
+
+def test_validate_service_data_valid(service_manager, valid_service_data):
+    """Test validation of valid service data."""
+    assert service_manager.validate_service_data(valid_service_data)
+
+@pytest.mark.parametrize("mutation,error", [
+    (lambda data: data.pop('owner'), 'Field required'),
+    (lambda data: data.__setitem__('version', '1.0'), 'Invalid version format'),
+    (lambda data: data.__setitem__('arch', 'invalid-arch'), 'Invalid architecture'),
+    (lambda data: data.__setitem__('sharable', 'invalid'), 'Invalid sharable value'),
+    (lambda data: data.__setitem__('deployment', {'invalid': 'format'}), 'Invalid deployment format'),
+], ids=['missing_field', 'invalid_version', 'invalid_arch', 'invalid_sharable', 'invalid_deployment'])
+def test_validate_service_data_invalid(service_manager, valid_service_data, mutation, error):
+    """Test validation of service data with a missing or invalid field."""
+    mutation(valid_service_data)
     
-    def test_validate_service_data_valid(self):
-        """Test validation of valid service data."""
-        self.assertTrue(self.service_manager.validate_service_data(self.valid_service_data))
-    
-    def test_validate_service_data_missing_field(self):
-        """Test validation of service data with missing required field."""
-        invalid_data = self.valid_service_data.copy()
-        del invalid_data['owner']
-        
-        with self.assertRaises(ValueError) as context:
-            self.service_manager.validate_service_data(invalid_data)
-        
-        self.assertIn('Field required', str(context.exception))
-    
-    def test_validate_service_data_invalid_version(self):
-        """Test validation of service data with invalid version."""
-        invalid_data = self.valid_service_data.copy()
-        invalid_data['version'] = '1.0'
-        
-        with self.assertRaises(ValueError) as context:
-            self.service_manager.validate_service_data(invalid_data)
-        
-        self.assertIn('Invalid version format', str(context.exception))
-    
-    def test_validate_service_data_invalid_arch(self):
-        """Test validation of service data with invalid architecture."""
-        invalid_data = self.valid_service_data.copy()
-        invalid_data['arch'] = 'invalid-arch'
-        
-        with self.assertRaises(ValueError) as context:
-            self.service_manager.validate_service_data(invalid_data)
-        
-        self.assertIn('Invalid architecture', str(context.exception))
-    
-    def test_validate_service_data_invalid_sharable(self):
-        """Test validation of service data with invalid sharable value."""
-        invalid_data = self.valid_service_data.copy()
-        invalid_data['sharable'] = 'invalid'
-        
-        with self.assertRaises(ValueError) as context:
-            self.service_manager.validate_service_data(invalid_data)
-        
-        self.assertIn('Invalid sharable value', str(context.exception))
+    with pytest.raises(ValueError, match=error):
+        service_manager.validate_service_data(valid_service_data)
+
+def test_create_service(service_manager, mock_client, valid_service_data):
+    """Test service creation with validation."""
+    mock_client.create_service.return_value = {'status': 'created'}
     
-    def test_validate_service_data_invalid_deployment(self):
-        """Test validation of service data with invalid deployment format."""
-        invalid_data = self.valid_service_data.copy()
-        invalid_data['deployment'] = {'invalid': 'format'}
-        
-        with self.assertRaises(ValueError) as context:
-            self.service_manager.validate_service_data(invalid_data)
-        
-        self.assertIn('Invalid deployment format', str(context.exception))
+    result = service_manager.create_service('test-org', valid_service_data)
     
-    def test_create_service(self):
-        """Test service creation with validation."""
-        self.mock_client.create_service.return_value = {'status': 'created'}
-        
-        result = self.service_manager.create_service('test-org', self.valid_service_data)
-        
-        self.assertEqual(result, {'status': 'created'})
-        self.mock_client.create_service.assert_called_once_with('test-org', self.valid_service_data)
+    assert result == {'status': 'created'}
+    mock_client.create_service.assert_called_once_with('test-org', valid_service_data)
+
+def test_update_service(service_manager, mock_client, valid_service_data):
+    """Test service update with validation."""
+    mock_client.update_service.return_value = {'status': 'updated'}
     
-    def test_update_service(self):
-        """Test service update with validation."""
-        self.mock_client.update_service.return_value = {'status': 'updated'}
-        
-        result = self.service_manager.update_service('test-org', 'test-service', self.valid_service_data)
-        
-        self.assertEqual(result, {'status': 'updated'})
-        self.mock_client.update_service.assert_called_once_with('test-org', 'test-service', self.valid_service_data)
+    result = service_manager.update_service('test-org', 'test-service', valid_service_data)
     
-    def test_search_services(self):
-        """Test service search functionality."""
-        mock_services = [
-            {'label': 'Test Service 1', 'description': 'First test service'},
-            {'label': 'Another Service', 'description': 'Second test service'},
-            {'label': 'Third Service', 'description': 'Not a test service'}
-        ]
-        self.mock_client.list_services.return_value = mock_services
-        
-        # Search for 'test'
-        results = self.service_manager.search_services('test-org', 'test')
-        self.assertEqual(len(results), 3)
-        
-        # Search for 'another'
-        results = self.service_manager.search_services('test-org', 'another')
-        self.assertEqual(len(results), 1)
-        
-        # Empty search
-        results = self.service_manager.search_services('test-org', '')
-        self.assertEqual(len(results), 3)
+    assert result == {'status': 'updated'}
+    mock_client.update_service.assert_called_once_with('test-org', 'test-service', valid_service_data)
+
+@pytest.mark.parametrize("query,expected", [
+    ('test', 3),
+    ('another', 1),
+    ('', 3),
+], ids=['test', 'another', 'empty'])
+def test_search_services(query, expected):
+    """Test service search functionality."""
+    client = _ListServicesStub(_SEARCHABLE_SERVICES)
     
-    def test_get_service_versions(self):
-        """Test getting service versions."""
-        mock_services = [
-            {'url': 'test-service', 'version': '1.0.0'},
-            {'url': 'test-service', 'version': '1.1.0'},
-            {'url': 'test-service', 'version': '2.0.0'},
-            {'url': 'other-service', 'version': '1.0.0'}
-        ]
-        self.mock_client.list_services.return_value = mock_services
-        
-        versions = self.service_manager.get_service_versions('test-org', 'test-service')
-        self.assertEqual(versions, ['1.0.0', '1.1.0', '2.0.0'])
+    results = ServiceManager(client).search_services('test-org', query)
+    assert len(results) == expected
+    assert client.orgs == ['test-org']
+
+def test_get_service_versions():
+    """Test getting service versions."""
+    service_manager = ServiceManager(_ListServicesStub(_VERSIONED_SERVICES))
     
-    def test_from_api_response(self):
-        """Test creating ServiceDefinition from API response."""
-        service = ServiceDefinition.from_api_response(self.valid_service_data)
-        self.assertEqual(service.owner, self.valid_service_data['owner'])
-        self.assertEqual(service.label, self.valid_service_data['label'])
-        self.assertEqual(service.version, self.valid_service_data['version'])
-        self.assertEqual(service.arch, self.valid_service_data['arch'])
-        self.assertEqual(service.sharable, self.valid_service_data['sharable'])
+    versions = service_manager.get_service_versions('test-org', 'test-service')
+    assert versions == ['1.0.0', '1.1.0', '2.0.0']
+
+def test_from_api_response(valid_service_data):
+    """Test creating ServiceDefinition from API response."""
+    service = ServiceDefinition.from_api_response(valid_service_data)
+    assert service.owner == valid_service_data['owner']
+    assert service.label == valid_service_data['label']
+    assert service.version == valid_service_data['version']
+    assert service.arch == valid_service_data['arch']
+    assert service.sharable == valid_service_data['sharable']
 
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    pytest.main([__file__])